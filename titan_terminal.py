@@ -6,37 +6,36 @@ A comprehensive financial analysis terminal using local LLMs.
 
 import sys
 import json
+import importlib
+import math
 import os
+import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import Future
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.layout import Layout
 from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.markdown import Markdown
 from rich.prompt import Prompt
 
-# Import modules
-from modules.company_profile import get_company_profile, render_company_profile
-from modules.financials import get_financials, render_financials
-from modules.technicals import get_technicals, render_technicals
-from modules.peer_analysis import get_peer_analysis, render_peer_analysis
-from modules.ownership import get_ownership, render_ownership
-from modules.analyst import get_analyst_data, render_analyst_data
-from modules.options import get_options_data, render_options_data
-from modules.news import get_news, render_news
-from modules.economic import get_market_data, render_market_overview
-from modules.supply_chain import get_supply_chain, render_supply_chain
-from modules.ai_engine import (
-    AIEngine, get_engine, build_analysis_prompt, render_ai_analysis
-)
-
 # Configuration
 WATCHLIST_FILE = Path(__file__).parent / "watchlist.json"
+LOOKUP_CACHE_FILE = Path(__file__).parent / "ticker_cache.json"
+LOOKUP_CACHE_TTL = 24 * 60 * 60  # seconds
 MODELS = [
     "deepseek-r1:latest",   # Reasoning specialist
     "gemma3:latest",        # Google's balanced model
@@ -46,16 +45,218 @@ MODELS = [
     "llama3.2:latest",      # Meta's latest
 ]
 
+# Smaller quantized tier for GPUs with limited VRAM (set TITAN_LOW_VRAM=1).
+# deepseek-r1 stays at full precision since it writes the executive summary.
+LOW_VRAM_MODELS = [
+    "deepseek-r1:latest",
+    "gemma3:4b-it-q4_K_M",
+    "qwen2.5:3b-instruct-q4_K_M",
+    "llama3.2:3b-instruct-q4_K_M",
+]
+LOW_VRAM_MODE = os.environ.get("TITAN_LOW_VRAM", "").lower() in ("1", "true", "yes")
+if LOW_VRAM_MODE:
+    MODELS = LOW_VRAM_MODELS
+
+# Quick-look subset for fast AI analysis (skips the slow deepseek-r1 reasoner)
+FAST_MODELS = [m for m in MODELS if not m.startswith("deepseek-r1")][:2]
+
+# Models loaded at startup. Low-VRAM mode warms a single small model only, since
+# loading the whole set at once would just make Ollama evict and reload them.
+PREWARM_MODELS = FAST_MODELS[:1] if LOW_VRAM_MODE else MODELS
+
+# Data fetchers per analyze_company cache key, as (module, function) so the
+# heavy data modules (yfinance/pandas) are only imported on first use
+MODULE_FETCHERS = {
+    "profile": ("modules.company_profile", "get_company_profile"),
+    "financials": ("modules.financials", "get_financials"),
+    "technicals": ("modules.technicals", "get_technicals"),
+    "peers": ("modules.peer_analysis", "get_peer_analysis"),
+    "ownership": ("modules.ownership", "get_ownership"),
+    "analyst": ("modules.analyst", "get_analyst_data"),
+    "options": ("modules.options", "get_options_data"),
+    "news": ("modules.news", "get_news"),
+    "supply_chain": ("modules.supply_chain", "get_supply_chain"),
+}
+
+# Per-company module data cache bounds
+ANALYSIS_CACHE_SIZE = 16
+ANALYSIS_CACHE_TTL = 300  # seconds
+
+# Modules users most often open next, prefetched after each menu choice
+NEXT_MODULES = {
+    "1": ["financials", "technicals"],
+    "2": ["technicals", "peers"],
+    "3": ["peers", "news"],
+    "4": ["ownership", "analyst"],
+    "5": ["analyst"],
+    "6": ["news"],
+    "7": ["news"],
+}
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire ttl seconds after being stored.
+
+    Deliberately minimal: only [], get, in and clear are supported,
+    and all of them skip expired entries. Reads don't refresh an entry's age.
+    """
+    
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (stored_at, value)
+    
+    def _expired(self, stored_at):
+        return time.monotonic() - stored_at > self.ttl
+    
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __getitem__(self, key):
+        stored_at, value = self._data[key]
+        if self._expired(stored_at):
+            del self._data[key]
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return value
+    
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and not self._expired(entry[0])
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def clear(self):
+        self._data.clear()
+
+
+@dataclass(slots=True)
+class TickerInfo:
+    """Resolved ticker plus the live quote shown in the header."""
+    symbol: str
+    name: str
+    exchange: str = "Unknown"
+    type: str = "EQUITY"
+    price: float = 0.0
+    change: float = 0.0
+    change_pct: float = 0.0
+    
+    # Dict-style access for modules that still treat ticker_info as a dict
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
 console = Console()
 
+# Batched watchlist quotes: {symbols tuple: (expires_at, quotes)}
+WATCHLIST_QUOTE_TTL = 60  # seconds
+WATCHLIST_QUOTE_RETRY_TTL = 15  # seconds before retrying a failed/empty fetch
+_quote_cache = {}
+
+# Models loaded in Ollama, as last reported by check_ollama_status
+OLLAMA_MODELS = []
+
+# Shared HTTP session so Yahoo/Ollama calls reuse pooled keep-alive
+# connections; also meant for modules/* to import instead of bare requests.
+HTTP = requests.Session()
+HTTP.headers.update({'User-Agent': 'Mozilla/5.0'})
+HTTP.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+HTTP.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+
+def json_loads(data):
+    """Parse JSON from str/bytes, using orjson when available."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dump_file(obj, path):
+    """Write obj to path as indented JSON, using orjson when available."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+LOOKUP_RESULT_KEYS = ("symbol", "name", "exchange", "type")
+
+
+def _clean_lookup_entry(entry):
+    """Return a well-formed, unexpired lookup cache entry, or None."""
+    if not isinstance(entry, dict) or not isinstance(entry.get("result"), dict):
+        return None
+    ts = entry.get("ts")
+    if not isinstance(ts, (int, float)) or time.time() - ts >= LOOKUP_CACHE_TTL:
+        return None
+    result = {k: entry["result"][k] for k in LOOKUP_RESULT_KEYS if k in entry["result"]}
+    if not result.get("symbol") or not result.get("name"):
+        return None
+    return {"result": result, "ts": ts}
+
+
+def load_lookup_cache():
+    """Load ticker lookup cache from file, dropping expired or malformed entries."""
+    if LOOKUP_CACHE_FILE.exists():
+        try:
+            cache = json_loads(LOOKUP_CACHE_FILE.read_bytes())
+            entries = {q: _clean_lookup_entry(e) for q, e in cache.items()}
+            return {q: e for q, e in entries.items() if e}
+        except:
+            return {}
+    return {}
+
+
+def save_lookup_cache():
+    """Save ticker lookup cache to file."""
+    try:
+        json_dump_file(_lookup_cache, LOOKUP_CACHE_FILE)
+    except OSError:
+        pass
+
+
+_lookup_cache = load_lookup_cache()
+
 
 def get_ticker_from_name(company_name):
-    """Search for stock ticker based on company name."""
+    """Search for stock ticker based on company name (cached for 24h)."""
+    key = company_name.strip().lower()
+    entry = _clean_lookup_entry(_lookup_cache.get(key))
+    if entry:
+        return TickerInfo(**entry["result"])
+    
+    result = _search_ticker(company_name)
+    if result:
+        _lookup_cache[key] = {"result": result, "ts": time.time()}
+        return TickerInfo(**result)
+    return None
+
+
+def _search_ticker(company_name):
+    """Query Yahoo Finance search for the best matching ticker."""
     try:
-        url = f"https://query2.finance.yahoo.com/v1/finance/search?q={company_name}"
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        response = requests.get(url, headers=headers, timeout=10)
-        data = response.json()
+        # Only the top quote is used, so ask Yahoo for just that (no news payload)
+        response = HTTP.get(
+            "https://query2.finance.yahoo.com/v1/finance/search",
+            params={"q": company_name, "quotesCount": 1, "newsCount": 0, "enableFuzzyQuery": "false"},
+            timeout=10,
+        )
+        data = json_loads(response.content)
 
         if 'quotes' in data and len(data['quotes']) > 0:
             best_match = data['quotes'][0]
@@ -74,8 +275,7 @@ def load_watchlist():
     """Load watchlist from file."""
     if WATCHLIST_FILE.exists():
         try:
-            with open(WATCHLIST_FILE, 'r') as f:
-                return json.load(f)
+            return json_loads(WATCHLIST_FILE.read_bytes())
         except:
             return {"stocks": []}
     return {"stocks": []}
@@ -83,17 +283,19 @@ def load_watchlist():
 
 def save_watchlist(watchlist):
     """Save watchlist to file."""
-    with open(WATCHLIST_FILE, 'w') as f:
-        json.dump(watchlist, f, indent=2)
+    json_dump_file(watchlist, WATCHLIST_FILE)
+    save_lookup_cache()
 
 
 def check_ollama_status():
     """Check if Ollama is running and display status."""
+    global OLLAMA_MODELS
     try:
-        response = requests.get("http://localhost:11434/api/ps", timeout=5)
+        response = HTTP.get("http://localhost:11434/api/ps", timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             running = data.get('models', [])
+            OLLAMA_MODELS = [m.get('name', '') for m in running]
             
             if running:
                 model_names = [m.get('name', '?') for m in running]
@@ -107,41 +309,71 @@ def check_ollama_status():
         return False
 
 
-def display_header(ticker_info=None):
-    """Display terminal header with domestic currency."""
-    console.clear()
+def prewarm_model(model):
+    """Load a model into Ollama memory ahead of the first AI analysis."""
+    try:
+        HTTP.post(
+            "http://localhost:11434/api/generate",
+            json={"model": model, "prompt": "", "keep_alive": "30m"},
+            timeout=300,
+        )
+    except requests.RequestException:
+        pass
+
+
+HEADER_TITLE = "[bold white on dark_blue] 🏛️  TITAN TERMINAL PRO  [/bold white on dark_blue]"
+
+MENU_PANEL = Panel(
+    Text.from_markup("""
+    [cyan][1][/cyan] Company Profile    [cyan][5][/cyan] Ownership          [cyan][9][/cyan] Watchlist
+    [cyan][2][/cyan] Financials         [cyan][6][/cyan] Analyst            [cyan][M][/cyan] Market Overview
+    [cyan][3][/cyan] Technical Charts   [cyan][7][/cyan] Options            [cyan][H][/cyan] Help
+    [cyan][4][/cyan] Peer Comparison    [cyan][8][/cyan] News & Sentiment   [cyan][Q][/cyan] Exit
     
-    header_text = "[bold white on dark_blue] 🏛️  TITAN TERMINAL PRO  [/bold white on dark_blue]"
+    [magenta][S][/magenta] Supply Chain (SPLC)   [yellow][0][/yellow] Full AI Analysis (Multi-Model)   [yellow][F][/yellow] Fast AI
+    [cyan][R][/cyan] Refresh Data
+    """),
+    title="📋 Menu",
+    border_style="cyan",
+)
+
+
+@lru_cache(maxsize=64)
+def _build_header(symbol="", name="", price=0, change=0, change_pct=0):
+    """Build the header panel; markup is parsed once per distinct quote."""
+    header_text = HEADER_TITLE
     
-    if ticker_info:
+    if symbol:
         from utils.formatters import get_currency_symbol
         
-        symbol = ticker_info.get("symbol", "")
-        name = ticker_info.get("name", "")
-        price = ticker_info.get("price", 0)
-        change = ticker_info.get("change", 0)
-        change_pct = ticker_info.get("change_pct", 0)
-        
         # Get correct currency symbol for the stock
         currency = get_currency_symbol(symbol)
         
         color = "green" if change >= 0 else "red"
-        header_text = f"[bold white on dark_blue] 🏛️  TITAN TERMINAL PRO  [/bold white on dark_blue] │ {name} ({symbol}) │ [{color}]{currency}{price:,.2f} {change:+.2f} ({change_pct:+.2f}%)[/{color}]"
+        header_text = f"{HEADER_TITLE} │ {name} ({symbol}) │ [{color}]{currency}{price:,.2f} {change:+.2f} ({change_pct:+.2f}%)[/{color}]"
     
-    console.print(Panel(header_text, style="blue"))
+    return Panel(Text.from_markup(header_text), style="blue")
+
+
+def display_header(ticker_info=None):
+    """Display terminal header with domestic currency."""
+    console.clear()
+    
+    if ticker_info:
+        console.print(_build_header(
+            ticker_info.symbol,
+            ticker_info.name,
+            ticker_info.price,
+            ticker_info.change,
+            ticker_info.change_pct,
+        ))
+    else:
+        console.print(_build_header())
 
 
 def display_menu():
     """Display the main menu."""
-    menu = """
-    [cyan][1][/cyan] Company Profile    [cyan][5][/cyan] Ownership          [cyan][9][/cyan] Watchlist
-    [cyan][2][/cyan] Financials         [cyan][6][/cyan] Analyst            [cyan][M][/cyan] Market Overview
-    [cyan][3][/cyan] Technical Charts   [cyan][7][/cyan] Options            [cyan][H][/cyan] Help
-    [cyan][4][/cyan] Peer Comparison    [cyan][8][/cyan] News & Sentiment   [cyan][Q][/cyan] Exit
-    
-    [magenta][S][/magenta] Supply Chain (SPLC)   [yellow][0][/yellow] Full AI Analysis (Multi-Model)
-    """
-    console.print(Panel(menu, title="📋 Menu", border_style="cyan"))
+    console.print(MENU_PANEL)
 
 
 def display_help():
@@ -167,7 +399,9 @@ def display_help():
 | 8 | News | Headlines with sentiment analysis |
 | 9 | Watchlist | Manage your saved stocks |
 | M | Market Overview | Indices, sectors, currencies, commodities |
+| R | Refresh | Clear cached module data (auto-expires after 5 min) |
 | 0 | AI Analysis | Full multi-model investment analysis |
+| F | Fast AI Analysis | Two-model quick take, no executive summary |
 
 ### AI Models
 The terminal uses local LLMs via Ollama:
@@ -179,39 +413,102 @@ The terminal uses local LLMs via Ollama:
 - Search with company names: "Apple", "Microsoft", "Tesla"
 - Or use tickers directly: "AAPL", "MSFT", "TSLA"
 - Watchlist is saved automatically between sessions
+- **F** and **R** are commands on the company menu, so typing them there
+  starts a fast AI analysis / refreshes data rather than opening Ford (F) or
+  Ryder (R); press **B** and search from the main prompt instead
     """
+    from rich.markdown import Markdown
     console.print(Markdown(help_text))
     Prompt.ask("\n[dim]Press Enter to continue[/dim]")
 
 
+def get_watchlist_quotes(symbols):
+    """Fetch last price and daily change for symbols in one batched download.
+
+    Returns {symbol: (price, change_pct)}; results are cached for
+    WATCHLIST_QUOTE_TTL seconds per symbol set. Failed or empty fetches are
+    cached too, for WATCHLIST_QUOTE_RETRY_TTL, so redraws don't keep retrying
+    while Yahoo is unreachable or rate-limiting.
+    """
+    key = tuple(symbols)
+    cached = _quote_cache.get(key)
+    if cached and time.time() < cached[0]:
+        return cached[1]
+    
+    quotes = {}
+    try:
+        import yfinance as yf
+        data = yf.download(list(symbols), period="5d", group_by="ticker", progress=False, threads=True)
+        
+        for symbol in symbols:
+            try:
+                # Multi-ticker downloads are grouped under the symbol; single ones may be flat
+                frame = data[symbol] if symbol in data.columns.get_level_values(0) else data
+                closes = frame["Close"].dropna()
+            except KeyError:
+                continue
+            if closes.empty:
+                continue
+            price = float(closes.iloc[-1])
+            prev_close = float(closes.iloc[-2]) if len(closes) > 1 else price
+            quotes[symbol] = (price, (price - prev_close) / prev_close * 100 if prev_close else 0)
+    except Exception:
+        pass
+    
+    ttl = WATCHLIST_QUOTE_TTL if quotes else WATCHLIST_QUOTE_RETRY_TTL
+    _quote_cache[key] = (time.time() + ttl, quotes)
+    return quotes
+
+
 def manage_watchlist():
     """Manage the watchlist."""
+    from utils.formatters import get_currency_symbol
+    
     watchlist = load_watchlist()
     
     while True:
-        console.clear()
-        console.print(Panel("[bold]📋 WATCHLIST[/bold]", border_style="yellow"))
-        
+        quotes = {}
         if watchlist["stocks"]:
-            wl_table = Table(show_header=True, header_style="bold")
-            wl_table.add_column("#", width=3)
-            wl_table.add_column("Symbol")
-            wl_table.add_column("Name")
-            wl_table.add_column("Added")
+            with console.status("[cyan]Fetching watchlist prices...[/cyan]"):
+                quotes = get_watchlist_quotes([s.get("symbol", "") for s in watchlist["stocks"]])
+        
+        with console:
+            console.clear()
+            console.print(Panel("[bold]📋 WATCHLIST[/bold]", border_style="yellow"))
             
-            for i, stock in enumerate(watchlist["stocks"], 1):
-                wl_table.add_row(
-                    str(i),
-                    stock.get("symbol", ""),
-                    stock.get("name", "")[:30],
-                    stock.get("added", "")[:10]
-                )
+            if watchlist["stocks"]:
+                wl_table = Table(show_header=True, header_style="bold")
+                wl_table.add_column("#", width=3)
+                wl_table.add_column("Symbol")
+                wl_table.add_column("Name")
+                wl_table.add_column("Price", justify="right")
+                wl_table.add_column("Change%", justify="right")
+                wl_table.add_column("Added")
+                
+                for i, stock in enumerate(watchlist["stocks"], 1):
+                    symbol = stock.get("symbol", "")
+                    if symbol in quotes:
+                        price, change_pct = quotes[symbol]
+                        color = "green" if change_pct >= 0 else "red"
+                        price_text = f"{get_currency_symbol(symbol)}{price:,.2f}"
+                        change_text = f"[{color}]{change_pct:+.2f}%[/{color}]"
+                    else:
+                        price_text = change_text = "[dim]-[/dim]"
+                    
+                    wl_table.add_row(
+                        str(i),
+                        symbol,
+                        stock.get("name", "")[:30],
+                        price_text,
+                        change_text,
+                        stock.get("added", "")[:10]
+                    )
+                
+                console.print(wl_table)
+            else:
+                console.print("[dim]Watchlist is empty.[/dim]")
             
-            console.print(wl_table)
-        else:
-            console.print("[dim]Watchlist is empty.[/dim]")
-        
-        console.print("\n[cyan][A][/cyan] Add  [cyan][R][/cyan] Remove  [cyan][B][/cyan] Back")
+            console.print("\n[cyan][A][/cyan] Add  [cyan][R][/cyan] Remove  [cyan][B][/cyan] Back")
         choice = Prompt.ask("Choose").strip().upper()
         
         if choice == "B":
@@ -221,12 +518,12 @@ def manage_watchlist():
             result = get_ticker_from_name(query)
             if result:
                 watchlist["stocks"].append({
-                    "symbol": result["symbol"],
-                    "name": result["name"],
+                    "symbol": result.symbol,
+                    "name": result.name,
                     "added": datetime.now().strftime("%Y-%m-%d")
                 })
                 save_watchlist(watchlist)
-                console.print(f"[green]Added {result['symbol']}[/green]")
+                console.print(f"[green]Added {result.symbol}[/green]")
             else:
                 console.print("[red]Could not find company[/red]")
             Prompt.ask("[dim]Press Enter[/dim]")
@@ -244,10 +541,19 @@ def manage_watchlist():
                 Prompt.ask("[dim]Press Enter[/dim]")
 
 
-def run_ai_analysis(ticker, ticker_info):
-    """Run full multi-model AI analysis with executive summary."""
-    company_name = ticker_info.get('name', ticker)
-    console.print(Panel(f"[bold]🤖 AI ANALYSIS: {company_name}[/bold]\n[dim]Running {len(MODELS)} models in parallel...[/dim]", border_style="cyan"))
+def run_ai_analysis(ticker, ticker_info, cache, mode="full"):
+    """Run multi-model AI analysis.
+
+    Input data comes from the company's module cache, so anything already
+    fetched or prefetched is reused. mode="full" runs every model plus the
+    executive summary; mode="fast" runs FAST_MODELS only and skips the
+    summary synthesis.
+    """
+    from modules.ai_engine import get_engine, build_analysis_prompt, render_ai_analysis
+    
+    models = FAST_MODELS if mode == "fast" else MODELS
+    company_name = ticker_info.name or ticker
+    console.print(Panel(f"[bold]🤖 AI ANALYSIS: {company_name}[/bold]\n[dim]Running {len(models)} models in parallel...[/dim]", border_style="cyan"))
     
     with Progress(
         SpinnerColumn(),
@@ -255,18 +561,27 @@ def run_ai_analysis(ticker, ticker_info):
         transient=True,
     ) as progress:
         task1 = progress.add_task("[cyan]Fetching fundamental data...", total=None)
-        fundamentals = get_financials(ticker)
-        
         task2 = progress.add_task("[magenta]Calculating technicals...", total=None)
-        technicals = get_technicals(ticker)
-        
         task3 = progress.add_task("[yellow]Fetching news...", total=None)
-        news_data = get_news(ticker)
+        
+        # Data sources are independent network calls - start whatever isn't
+        # cached or already prefetching, concurrently. Background threads are
+        # never joined, so Ctrl-C aborts immediately.
+        for key in ("financials", "technicals", "news"):
+            if key not in cache:
+                cache[key] = submit_background(fetch_module_data, key, ticker)
+        
+        fundamentals = load_module_data(cache, "financials", ticker)
+        progress.remove_task(task1)
+        technicals = load_module_data(cache, "technicals", ticker)
+        progress.remove_task(task2)
+        news_data = load_module_data(cache, "news", ticker)
+        progress.remove_task(task3)
         news_items = news_data.get("news", [])
         
         # Show which models are running
-        model_names = [m.split(':')[0] for m in MODELS]
-        task4 = progress.add_task(f"[green]Running {len(MODELS)} AI models: {', '.join(model_names)}...", total=None)
+        model_names = [m.split(':')[0] for m in models]
+        task4 = progress.add_task(f"[green]Running {len(models)} AI models: {', '.join(model_names)}...", total=None)
         
         # Build prompt
         prompt = build_analysis_prompt(
@@ -278,30 +593,89 @@ def run_ai_analysis(ticker, ticker_info):
         )
         
         # Get AI engine and generate reports
-        engine = get_engine(MODELS)
+        engine = get_engine(models)
         system_prompt = "You are a decisive Wall Street equity analyst. Every company is DIFFERENT - your verdicts must reflect their UNIQUE data. Always cite specific numbers. Be decisive."
         
         reports = engine.generate_multi_model_reports(prompt, system_prompt)
         consensus = engine.get_consensus(reports)
         
-        # Generate executive summary
-        task5 = progress.add_task("[magenta]Synthesizing executive summary (deepseek-r1)...", total=None)
-        executive_summary = engine.generate_executive_summary(reports, consensus, ticker, company_name)
+        if mode == "fast":
+            executive_summary = None
+        else:
+            # Generate executive summary
+            task5 = progress.add_task("[magenta]Synthesizing executive summary (deepseek-r1)...", total=None)
+            executive_summary = engine.generate_executive_summary(reports, consensus, ticker, company_name)
     
-    # Render results with executive summary
+    # Render results (fast mode has no executive summary)
     render_ai_analysis(reports, consensus, console, executive_summary)
 
 
 
+def submit_background(fn, *args):
+    """Run fn(*args) on a daemon thread and return a Future for its result.
+
+    Unlike ThreadPoolExecutor workers, these threads are never joined at exit,
+    so quitting doesn't wait on an in-flight fetch.
+    """
+    future = Future()
+    
+    def _run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=_run, daemon=True).start()
+    return future
+
+
+def fetch_module_data(key, ticker):
+    """Import the data module for a cache key on demand and fetch its data."""
+    module_name, func_name = MODULE_FETCHERS[key]
+    return getattr(importlib.import_module(module_name), func_name)(ticker)
+
+
+_MISSING = object()
+
+
+def load_module_data(cache, key, ticker):
+    """Return cached module data, waiting on a prefetch or fetching as needed."""
+    data = cache.get(key, _MISSING)
+    if data is not _MISSING and not isinstance(data, Future):
+        # Cache hit - don't write back, or the entry's TTL would restart
+        return data
+    if isinstance(data, Future):
+        try:
+            data = data.result()
+        except Exception:
+            data = _MISSING
+    if data is _MISSING:
+        data = fetch_module_data(key, ticker)
+    cache[key] = data
+    return data
+
+
+def prefetch_modules(cache, choice, ticker):
+    """Start background fetches for the modules likely to be opened next."""
+    for key in NEXT_MODULES.get(choice, []):
+        if key not in cache:
+            cache[key] = submit_background(fetch_module_data, key, ticker)
+
+
 def analyze_company(ticker, ticker_info):
     """Main analysis loop for a company."""
     
-    # Cache for fetched data
-    cache = {}
+    # Cache for fetched data; entries age out so long sessions see fresh data.
+    # Prefetches still in flight when the user leaves are simply abandoned.
+    cache = _TTLCache(maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL)
     
     while True:
-        display_header(ticker_info)
-        display_menu()
+        # Buffer clear + redraw into a single terminal write to avoid flicker
+        with console:
+            display_header(ticker_info)
+            display_menu()
         
         choice = Prompt.ask("Enter command").strip().upper()
         
@@ -317,58 +691,58 @@ def analyze_company(ticker, ticker_info):
             if choice == "1":
                 # Company Profile
                 with console.status("[cyan]Loading company profile...[/cyan]"):
-                    if "profile" not in cache:
-                        cache["profile"] = get_company_profile(ticker)
-                render_company_profile(cache["profile"], console)
+                    data = load_module_data(cache, "profile", ticker)
+                from modules.company_profile import render_company_profile
+                render_company_profile(data, console)
             
             elif choice == "2":
                 # Financials
                 with console.status("[cyan]Loading financial data...[/cyan]"):
-                    if "financials" not in cache:
-                        cache["financials"] = get_financials(ticker)
-                render_financials(cache["financials"], console)
+                    data = load_module_data(cache, "financials", ticker)
+                from modules.financials import render_financials
+                render_financials(data, console)
             
             elif choice == "3":
                 # Technical Analysis
                 with console.status("[cyan]Calculating technicals...[/cyan]"):
-                    if "technicals" not in cache:
-                        cache["technicals"] = get_technicals(ticker)
-                render_technicals(cache["technicals"], console)
+                    data = load_module_data(cache, "technicals", ticker)
+                from modules.technicals import render_technicals
+                render_technicals(data, console)
             
             elif choice == "4":
                 # Peer Comparison
                 with console.status("[cyan]Analyzing peers...[/cyan]"):
-                    if "peers" not in cache:
-                        cache["peers"] = get_peer_analysis(ticker)
-                render_peer_analysis(cache["peers"], console)
+                    data = load_module_data(cache, "peers", ticker)
+                from modules.peer_analysis import render_peer_analysis
+                render_peer_analysis(data, console)
             
             elif choice == "5":
                 # Ownership
                 with console.status("[cyan]Loading ownership data...[/cyan]"):
-                    if "ownership" not in cache:
-                        cache["ownership"] = get_ownership(ticker)
-                render_ownership(cache["ownership"], console)
+                    data = load_module_data(cache, "ownership", ticker)
+                from modules.ownership import render_ownership
+                render_ownership(data, console)
             
             elif choice == "6":
                 # Analyst Data
                 with console.status("[cyan]Loading analyst data...[/cyan]"):
-                    if "analyst" not in cache:
-                        cache["analyst"] = get_analyst_data(ticker)
-                render_analyst_data(cache["analyst"], console)
+                    data = load_module_data(cache, "analyst", ticker)
+                from modules.analyst import render_analyst_data
+                render_analyst_data(data, console)
             
             elif choice == "7":
                 # Options
                 with console.status("[cyan]Loading options chain...[/cyan]"):
-                    if "options" not in cache:
-                        cache["options"] = get_options_data(ticker)
-                render_options_data(cache["options"], console)
+                    data = load_module_data(cache, "options", ticker)
+                from modules.options import render_options_data
+                render_options_data(data, console)
             
             elif choice == "8":
                 # News
                 with console.status("[cyan]Fetching news...[/cyan]"):
-                    if "news" not in cache:
-                        cache["news"] = get_news(ticker)
-                render_news(cache["news"], console)
+                    data = load_module_data(cache, "news", ticker)
+                from modules.news import render_news
+                render_news(data, console)
             
             elif choice == "9":
                 # Watchlist
@@ -377,25 +751,41 @@ def analyze_company(ticker, ticker_info):
             
             elif choice == "M":
                 # Market Overview
+                from modules.economic import get_market_data, render_market_overview
                 with console.status("[cyan]Loading market data...[/cyan]"):
                     market_data = get_market_data()
                 render_market_overview(market_data, console)
             
             elif choice == "0":
-                # Full AI Analysis
-                run_ai_analysis(ticker, ticker_info)
+                # Full AI Analysis (Ctrl-C aborts back to the menu)
+                try:
+                    run_ai_analysis(ticker, ticker_info, cache)
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]AI analysis aborted.[/yellow]")
+            
+            elif choice == "F":
+                # Fast AI Analysis (subset of models, no executive summary)
+                try:
+                    run_ai_analysis(ticker, ticker_info, cache, mode="fast")
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]AI analysis aborted.[/yellow]")
             
             elif choice == "S":
                 # Supply Chain (SPLC)
                 with console.status("[magenta]Loading supply chain data...[/magenta]"):
-                    if "supply_chain" not in cache:
-                        cache["supply_chain"] = get_supply_chain(ticker)
-                render_supply_chain(cache["supply_chain"], console)
+                    data = load_module_data(cache, "supply_chain", ticker)
+                from modules.supply_chain import render_supply_chain
+                render_supply_chain(data, console)
             
             elif choice == "H":
                 display_help()
                 continue
             
+            elif choice == "R":
+                # Refresh - drop cached module data
+                cache.clear()
+                console.print("[green]Cached data cleared; modules will reload.[/green]")
+            
             else:
                 # Try as a new search
                 result = get_ticker_from_name(choice)
@@ -406,13 +796,58 @@ def analyze_company(ticker, ticker_info):
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
         
+        prefetch_modules(cache, choice, ticker)
         Prompt.ask("\n[dim]Press Enter to continue[/dim]")
 
 
+def fill_price(result):
+    """Populate price/change fields on a TickerInfo.
+
+    Uses yfinance's lightweight fast_info quote first and only falls back to
+    the full info dict when that comes back empty.
+    """
+    try:
+        import yfinance as yf
+        stock = yf.Ticker(result.symbol)
+        price = prev_close = None
+        
+        try:
+            fi = stock.fast_info
+            price = fi.last_price
+            prev_close = fi.previous_close or fi.regular_market_previous_close
+        except Exception:
+            price = None
+        
+        # fast_info reports NaN for thinly traded or halted symbols
+        if price is not None and math.isnan(price):
+            price = None
+        if prev_close is not None and math.isnan(prev_close):
+            prev_close = None
+        
+        if not price:
+            info = stock.info
+            price = info.get("regularMarketPrice") or info.get("currentPrice") or 0
+            prev_close = info.get("previousClose")
+        
+        result.price = price
+        result.change = price - (prev_close or price)
+        result.change_pct = (result.change / prev_close) * 100 if prev_close else 0
+    except:
+        result.price = 0
+        result.change = 0
+        result.change_pct = 0
+
+
 def main():
     """Main terminal loop."""
     display_header()
-    check_ollama_status()
+    if check_ollama_status():
+        # Load models into VRAM while the user is still picking a company,
+        # skipping any that Ollama already reports as loaded
+        # (daemon threads, so quitting never waits on a model load)
+        for model in PREWARM_MODELS:
+            if model not in OLLAMA_MODELS:
+                threading.Thread(target=prewarm_model, args=(model,), daemon=True).start()
     
     # Show all models that power the terminal
     model_names = [m.split(':')[0] for m in MODELS]
@@ -434,6 +869,7 @@ def main():
             break
         
         if query.upper() == "M":
+            from modules.economic import get_market_data, render_market_overview
             with console.status("[cyan]Loading market data...[/cyan]"):
                 market_data = get_market_data()
             render_market_overview(market_data, console)
@@ -452,21 +888,11 @@ def main():
             console.print(f"[red]Could not find company matching '{query}'[/red]")
             continue
         
-        ticker = result["symbol"]
-        console.print(f"[green]✔ Found:[/green] {result['name']} ({ticker}) on {result['exchange']}")
+        ticker = result.symbol
+        console.print(f"[green]✔ Found:[/green] {result.name} ({ticker}) on {result.exchange}")
         
         # Get current price for header
-        try:
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            result["price"] = info.get("regularMarketPrice") or info.get("currentPrice") or 0
-            result["change"] = result["price"] - (info.get("previousClose") or result["price"])
-            result["change_pct"] = (result["change"] / info.get("previousClose", 1)) * 100 if info.get("previousClose") else 0
-        except:
-            result["price"] = 0
-            result["change"] = 0
-            result["change_pct"] = 0
+        fill_price(result)
         
         # Enter analysis mode
         while True:
@@ -481,19 +907,10 @@ def main():
             
             if isinstance(action, tuple) and action[0] == "new_ticker":
                 result = action[1]
-                ticker = result["symbol"]
+                ticker = result.symbol
                 
                 # Fetch price data for new ticker
-                try:
-                    stock = yf.Ticker(ticker)
-                    info = stock.info
-                    result["price"] = info.get("regularMarketPrice") or info.get("currentPrice") or 0
-                    result["change"] = result["price"] - (info.get("previousClose") or result["price"])
-                    result["change_pct"] = (result["change"] / info.get("previousClose", 1)) * 100 if info.get("previousClose") else 0
-                except:
-                    result["price"] = 0
-                    result["change"] = 0
-                    result["change_pct"] = 0
+                fill_price(result)
 
 
 if __name__ == "__main__":
@@ -502,3 +919,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted. Goodbye![/yellow]")
         sys.exit(0)
+    finally:
+        save_lookup_cache()